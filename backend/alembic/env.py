@@ -4,8 +4,8 @@ import sys
 from logging.config import fileConfig
 
 from sqlalchemy import pool
-from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from alembic import context
 
@@ -78,13 +78,26 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
-async def run_async_migrations() -> None:
-    """Run migrations in async mode."""
-    connectable = create_async_engine(
-        settings.DATABASE_URL,
+def migration_engine(url: str) -> AsyncEngine:
+    """Create the engine used to run migrations.
+
+    asyncpg's prepared-statement cache is invalidated by every DDL statement,
+    so it is disabled here; the application engine keeps caching enabled.
+    """
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    return create_async_engine(
+        url,
         poolclass=pool.NullPool,
+        connect_args=connect_args,
     )
 
+
+async def run_async_migrations() -> None:
+    """Run migrations in async mode."""
+    connectable = migration_engine(settings.DATABASE_URL)
+
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
 
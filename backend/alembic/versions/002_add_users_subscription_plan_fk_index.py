@@ -0,0 +1,23 @@
+"""Add index on users.subscription_plan_id foreign key
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-02-10 09:00:00.000000
+
+"""
+from app.core.migrations import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so deploys against a populated users table don't block writers
+    create_index_concurrently('ix_users_subscription_plan_id', 'users', ['subscription_plan_id'])
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_users_subscription_plan_id')
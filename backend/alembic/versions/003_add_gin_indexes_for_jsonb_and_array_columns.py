@@ -0,0 +1,32 @@
+"""Add GIN indexes for JSONB and ARRAY columns
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-02-10 09:30:00.000000
+
+"""
+from app.core.migrations import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports containment (@>) but is smaller and faster than the default opclass
+    create_index_concurrently(
+        'ix_subscription_plans_features_gin', 'subscription_plans',
+        ['features jsonb_path_ops'], using='gin',
+    )
+    # "users publishing to platform X" lookups: preferred_platforms @> ARRAY['wordpress']
+    create_index_concurrently(
+        'ix_users_preferred_platforms_gin', 'users',
+        ['preferred_platforms'], using='gin',
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_users_preferred_platforms_gin')
+    drop_index_concurrently('ix_subscription_plans_features_gin')
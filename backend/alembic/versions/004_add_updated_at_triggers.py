@@ -0,0 +1,39 @@
+"""Maintain updated_at with BEFORE UPDATE triggers
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-02-10 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+# Tables with an updated_at column
+UPDATED_AT_TABLES = ['subscription_plans', 'users']
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := clock_timestamp();
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    for table in UPDATED_AT_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(UPDATED_AT_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,76 @@
+"""
+Shared helpers for Alembic migration scripts
+"""
+from typing import Optional, Sequence
+
+from alembic import op
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def create_index_concurrently(
+    name: str,
+    table: str,
+    cols: Sequence[str],
+    unique: bool = False,
+    using: Optional[str] = None,
+) -> None:
+    """Create an index without taking a write-blocking lock on the table.
+
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction, so the
+    statement is issued from an autocommit block. ``cols`` entries may carry
+    an operator class, e.g. ``"features jsonb_path_ops"`` with ``using="gin"``.
+    """
+    unique_sql = "UNIQUE " if unique else ""
+    using_sql = f" USING {using}" if using else ""
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE {unique_sql}INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON {table}{using_sql} ({', '.join(cols)})"
+        )
+
+
+def drop_index_concurrently(name: str) -> None:
+    """Drop an index created by create_index_concurrently (downgrade counterpart)"""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def batched_update(conn: Connection, table: str, pk: str, set_clause: str, batch_size: int = 10000) -> int:
+    """Backfill a table in primary-key ranges instead of OFFSET/LIMIT pages.
+
+    Batch boundaries are found with a single row_number() pass, then each
+    batch updates a contiguous ``pk`` range, so the total cost stays linear
+    in the table size. This is the required pattern for data migrations
+    touching large tables such as blog_posts and post_analytics.
+
+    Example::
+
+        batched_update(op.get_bind(), "blog_posts", "id",
+                       "reading_time = GREATEST(1, word_count / 200)")
+    """
+    bounds = conn.execute(
+        text(
+            f"SELECT {pk} FROM ("
+            f"SELECT {pk}, row_number() OVER (ORDER BY {pk}) AS rn FROM {table}"
+            f") AS numbered WHERE rn % :batch_size = 0 ORDER BY {pk}"
+        ),
+        {"batch_size": batch_size},
+    ).scalars().all()
+
+    updated = 0
+    lower = None
+    for upper in [*bounds, None]:
+        conditions = []
+        params = {}
+        if lower is not None:
+            conditions.append(f"{pk} > :lower")
+            params["lower"] = lower
+        if upper is not None:
+            conditions.append(f"{pk} <= :upper")
+            params["upper"] = upper
+        where_clause = " AND ".join(conditions) or "TRUE"
+        result = conn.execute(text(f"UPDATE {table} SET {set_clause} WHERE {where_clause}"), params)
+        updated += result.rowcount
+        lower = upper
+    return updated
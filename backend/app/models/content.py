@@ -1,9 +1,8 @@
 """
 Content management models for blog posts, versions, and templates
 """
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, JSON, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
 from app.core.database import Base
 import uuid
 
@@ -11,6 +10,13 @@ import uuid
 class BlogPost(Base):
     """Blog post model with SEO and content management features"""
     __tablename__ = "blog_posts"
+    __table_args__ = (
+        # Covers the "my posts" dashboard listing so Postgres can answer it with an index-only scan
+        Index(
+            'ix_blog_posts_user_dashboard', 'user_id', 'created_at',
+            postgresql_include=['title', 'status', 'word_count'],
+        ),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -24,7 +30,7 @@ class BlogPost(Base):
     seo_score = Column(Integer, default=0)
     word_count = Column(Integer, default=0)
     reading_time = Column(Integer, default=0)  # in minutes
-    slug = Column(String(500), unique=True)
+    slug = Column(String(200), unique=True)
     featured_image_url = Column(String(500))
     is_template = Column(Boolean, default=False)
     template_category = Column(String(100))
@@ -1,9 +1,8 @@
 """
 User management models for authentication and subscription handling
 """
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, DECIMAL, Text, JSON
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, DECIMAL, JSON
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
 from app.core.database import Base
 import uuid
 
@@ -5,8 +5,6 @@ import os
 import re
 from pathlib import Path
 from typing import Dict, List, Any
-import markdown
-from PIL import Image
 
 class FileParser:
     def __init__(self):
@@ -68,14 +66,8 @@ class FileParser:
         Parse text-based files and return content
         """
         try:
-            content = file_path.read_text(encoding='utf-8')
-            
-            if file_path.suffix.lower() == '.md':
-                # Convert markdown to HTML for processing
-                html_content = markdown.markdown(content)
-                return content  # Return original markdown
-            
-            return content
+            # Markdown is returned unrendered, as before
+            return file_path.read_text(encoding='utf-8')
         except Exception as e:
             print(f"Error parsing file {file_path}: {e}")
             return ""
@@ -84,6 +76,9 @@ class FileParser:
         """
         Parse image files and extract metadata
         """
+        # Pillow is heavy to import and only needed when a folder contains images
+        from PIL import Image
+
         try:
             with Image.open(file_path) as img:
                 return {
@@ -127,11 +122,12 @@ class FileParser:
         """
         Extract metadata from content (tags, categories, etc.)
         """
+        word_count = len(content.split())
         metadata = {
             'tags': [],
             'categories': [],
-            'word_count': len(content.split()),
-            'reading_time': max(1, len(content.split()) // 200)  # Assume 200 WPM
+            'word_count': word_count,
+            'reading_time': max(1, word_count // 200)  # Assume 200 WPM
         }
         
         # Extract hashtags as tags